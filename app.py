@@ -1,21 +1,317 @@
 # app.py
 # Import necessary libraries
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify
+from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, Response
 import mysql.connector
 from datetime import datetime, date, timedelta
-from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.security import generate_password_hash, check_password_hash, DEFAULT_PBKDF2_ITERATIONS
 from flask_login import LoginManager, UserMixin, login_user, logout_user, login_required, current_user
 from functools import wraps
 import random
 import string
+import re
+import zlib
+import itertools
+import threading
+from werkzeug.wsgi import ClosingIterator
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; responses fall back to gzip without it
+    brotli = None
 
 # --- Flask App Initialization & Configuration ---
 import config
+import shopping
 
 app = Flask(__name__)
 # Load configuration from the config file
 app.config['SECRET_KEY'] = config.SECRET_KEY
 DB_CONFIG = config.DB_CONFIG
+# Responses smaller than this (in bytes) are not worth compressing
+app.config['COMPRESS_MIN_SIZE'] = getattr(config, 'COMPRESS_MIN_SIZE', 500)
+app.config['COMPRESS_LEVEL'] = getattr(config, 'COMPRESS_LEVEL', 6)
+# Streamed bodies are compressed and flushed in blocks of this many bytes
+app.config['COMPRESS_STREAM_BLOCK'] = getattr(config, 'COMPRESS_STREAM_BLOCK', 8192)
+# Strip indentation left behind by block tags at render time
+app.jinja_env.trim_blocks = True
+app.jinja_env.lstrip_blocks = True
+
+# --- Response Compression & HTML Minification ---
+COMPRESSIBLE_MIMETYPES = {'text/html', 'text/plain', 'text/css', 'text/csv', 'application/json', 'application/javascript'}
+# <pre> and <textarea> keep their whitespace, everything else loses line indentation
+_PRESERVE_WHITESPACE_RE = re.compile(r'(<(pre|textarea)\b.*?</\2>)', re.IGNORECASE | re.DOTALL)
+_INDENT_RE = re.compile(r'\n\s+')
+compression_stats = {}
+compression_stats_lock = threading.Lock()
+
+def minify_html(html):
+    """Removes line indentation and blank lines outside of <pre>/<textarea> blocks."""
+    parts = _PRESERVE_WHITESPACE_RE.split(html)
+    # split() yields [text, block, tag name, text, block, tag name, ...]
+    for i in range(0, len(parts), 3):
+        parts[i] = _INDENT_RE.sub('\n', parts[i])
+    return ''.join(parts[j] for j in range(len(parts)) if j % 3 != 2)
+
+def choose_encoding():
+    """Picks the best encoding the client accepts: brotli if available, then gzip."""
+    accepted = request.accept_encodings
+    if brotli is not None and accepted['br'] > 0 and accepted['br'] >= accepted['gzip']:
+        return 'br'
+    if accepted['gzip'] > 0:
+        return 'gzip'
+    return None
+
+def record_savings(route, original_size, sent_size):
+    """Adds one response to the per-route stats: its identity size and the bytes actually sent."""
+    with compression_stats_lock:
+        stats = compression_stats.setdefault(route, {'responses': 0, 'original_bytes': 0, 'sent_bytes': 0, 'bytes_saved': 0})
+        stats['responses'] += 1
+        stats['original_bytes'] += original_size
+        stats['sent_bytes'] += sent_size
+        stats['bytes_saved'] += original_size - sent_size
+
+def compress_bytes(data, encoding):
+    if encoding == 'br':
+        return brotli.compress(data, quality=app.config['COMPRESS_LEVEL'])
+    compressor = zlib.compressobj(app.config['COMPRESS_LEVEL'], zlib.DEFLATED, 31)
+    return compressor.compress(data) + compressor.flush()
+
+def make_stream_compressor(encoding):
+    """Returns (compress, flush, finish) callables for incremental compression."""
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=app.config['COMPRESS_LEVEL'])
+        return compressor.process, compressor.flush, compressor.finish
+    compressor = zlib.compressobj(app.config['COMPRESS_LEVEL'], zlib.DEFLATED, 31)
+    return compressor.compress, lambda: compressor.flush(zlib.Z_SYNC_FLUSH), compressor.flush
+
+def read_block(chunks, size):
+    """Pulls chunks until at least `size` bytes are buffered; returns (block, exhausted)."""
+    block = []
+    length = 0
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        block.append(chunk)
+        length += len(chunk)
+        if length >= size:
+            return b''.join(block), False
+    return b''.join(block), True
+
+def compress_stream(codec, head, head_size, chunks, route):
+    """Yields an already compressed first block, then compresses the rest block by block.
+
+    Flushing once per block rather than per chunk keeps the client seeing progress without
+    paying the flush overhead on every small write. Closing the original iterable is left to
+    the caller, since this generator's cleanup never runs if the body is not iterated
+    (e.g. HEAD requests).
+    """
+    compress, flush, finish = codec
+    original_size, sent_size = head_size, len(head)
+    try:
+        yield head
+        exhausted = False
+        while not exhausted:
+            block, exhausted = read_block(chunks, app.config['COMPRESS_STREAM_BLOCK'])
+            out = compress(block) + (finish() if exhausted else flush())
+            original_size += len(block)
+            sent_size += len(out)
+            if out:
+                yield out
+    finally:
+        # Headers are already sent, so a stream that grew cannot fall back; it just isn't counted
+        if sent_size < original_size:
+            record_savings(route, original_size, sent_size)
+
+@app.after_request
+def compress_response(response):
+    # Partial content ranges describe identity bytes and cannot be compressed after the fact
+    if (response.status_code < 200 or response.status_code >= 300 or response.status_code in (204, 206)
+            or 'Content-Encoding' in response.headers or 'Content-Range' in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+        return response
+    response.vary.add('Accept-Encoding')
+    encoding = choose_encoding()
+    route = request.url_rule.rule if request.url_rule else request.path
+
+    if response.is_streamed:
+        if encoding is None:
+            return response
+        original = response.response
+        close_callbacks = [original.close] if hasattr(original, 'close') else []
+        chunks = iter(original)
+        # Hold back the first block: a short stream is handled like a buffered response below,
+        # and a block that does not shrink means the stream is sent as-is
+        block_size = max(app.config['COMPRESS_STREAM_BLOCK'], app.config['COMPRESS_MIN_SIZE'])
+        head, exhausted = read_block(chunks, block_size)
+        if exhausted:
+            for close in close_callbacks:
+                close()
+            response.set_data(head)
+            response.direct_passthrough = False
+        else:
+            codec = make_stream_compressor(encoding)
+            compressed_head = codec[0](head) + codec[1]()
+            response.direct_passthrough = False
+            if len(compressed_head) >= len(head):
+                response.response = ClosingIterator(itertools.chain([head], chunks), close_callbacks)
+                return response
+            response.response = ClosingIterator(compress_stream(codec, compressed_head, len(head), chunks, route), close_callbacks)
+            response.headers['Content-Encoding'] = encoding
+            response.headers.pop('Content-Length', None)
+            # The encoded bytes of a stream are unknown up front, so a strong ETag cannot hold;
+            # the encoding suffix still keeps it distinct from the identity representation
+            etag, weak = response.get_etag()
+            if etag:
+                response.set_etag(f"{etag}-{encoding}", weak=True)
+            return response
+
+    data = response.get_data()
+    original_size = len(data)
+    if response.mimetype == 'text/html':
+        response.set_data(minify_html(response.get_data(as_text=True)))
+        data = response.get_data()
+    if encoding is None or len(data) < app.config['COMPRESS_MIN_SIZE']:
+        record_savings(route, original_size, len(data))
+        return response
+
+    # Each encoding is a different representation, so it gets its own ETag derived from the
+    # identity body; a matching If-None-Match short-circuits to a 304 before compressing.
+    etag, weak = response.get_etag()
+    if etag is None:
+        response.add_etag()
+        etag, weak = response.get_etag()
+    response.set_etag(f"{etag}-{encoding}", weak=weak)
+    response.make_conditional(request)
+    if response.status_code == 304:
+        return response
+
+    compressed = compress_bytes(data, encoding)
+    if len(compressed) >= len(data):
+        response.set_etag(etag, weak=weak)
+        record_savings(route, original_size, len(data))
+        return response
+    response.set_data(compressed)
+    response.headers['Content-Encoding'] = encoding
+    record_savings(route, original_size, len(compressed))
+    return response
+
+# --- Password Hashing & Login Throttling ---
+# Hashes stored with a different algorithm or lower cost are upgraded on the user's next successful login
+PASSWORD_HASH_METHOD = getattr(config, 'PASSWORD_HASH_METHOD', f'pbkdf2:sha256:{DEFAULT_PBKDF2_ITERATIONS}')
+HASH_WORKERS = getattr(config, 'HASH_WORKERS', 2)
+HASH_MAX_PENDING = getattr(config, 'HASH_MAX_PENDING', 8)
+HASH_TIMEOUT = getattr(config, 'HASH_TIMEOUT', 10)
+LOGIN_ATTEMPT_WINDOW = getattr(config, 'LOGIN_ATTEMPT_WINDOW', 900)
+LOGIN_MAX_ATTEMPTS_PER_USER = getattr(config, 'LOGIN_MAX_ATTEMPTS_PER_USER', 5)
+LOGIN_MAX_ATTEMPTS_PER_IP = getattr(config, 'LOGIN_MAX_ATTEMPTS_PER_IP', 20)
+REGISTER_MAX_ATTEMPTS_PER_IP = getattr(config, 'REGISTER_MAX_ATTEMPTS_PER_IP', 10)
+# Stored hashes using one of these algorithms, at or above the listed cost, are kept as they are
+# even when PASSWORD_HASH_METHOD names a different algorithm
+ACCEPTED_HASH_METHODS = getattr(config, 'ACCEPTED_HASH_METHODS', ['scrypt'])
+
+hash_executor = ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix='password-hash')
+hash_slots = threading.BoundedSemaphore(HASH_MAX_PENDING)
+auth_attempts = {}
+auth_attempts_lock = threading.Lock()
+
+class HashingBusyError(Exception):
+    """Raised when the hashing pool is saturated or a hash did not finish in time."""
+
+def submit_hashing(func, *args, **kwargs):
+    """Queues a hashing call on the bounded pool, refusing work once the queue is full."""
+    if not hash_slots.acquire(blocking=False):
+        raise HashingBusyError()
+    try:
+        future = hash_executor.submit(func, *args, **kwargs)
+    except Exception:
+        hash_slots.release()
+        raise
+    future.add_done_callback(lambda f: hash_slots.release())
+    return future
+
+def run_hashing(func, *args, **kwargs):
+    """Runs a hashing call on the pool and waits for it, so a burst never occupies every request thread."""
+    try:
+        return submit_hashing(func, *args, **kwargs).result(timeout=HASH_TIMEOUT)
+    except FutureTimeoutError:
+        raise HashingBusyError()
+
+def hash_password(password):
+    return run_hashing(generate_password_hash, password, method=PASSWORD_HASH_METHOD)
+
+def verify_password(password_hash, password):
+    return run_hashing(check_password_hash, password_hash, password)
+
+def parse_hash_method(method):
+    """Splits a Werkzeug hash method into its algorithm and numeric cost parameters."""
+    parts = method.split(':')
+    if parts[0] == 'pbkdf2':
+        hash_name = parts[1] if len(parts) > 1 else 'sha256'
+        return f'pbkdf2:{hash_name}', tuple(int(p) for p in parts[2:] or [DEFAULT_PBKDF2_ITERATIONS])
+    if parts[0] == 'scrypt':
+        # Werkzeug's scrypt defaults are n=2**15, r=8, p=1
+        return 'scrypt', tuple(int(p) for p in parts[1:] or [2 ** 15, 8, 1])
+    return method, ()
+
+def password_needs_rehash(password_hash):
+    """True unless the stored hash uses PASSWORD_HASH_METHOD or an accepted algorithm at no lower a cost."""
+    try:
+        stored_algorithm, stored_params = parse_hash_method(password_hash.split('$', 1)[0])
+    except ValueError:
+        return True
+    # The configured method comes last so its cost overrides an accepted entry for the same algorithm
+    accepted = dict(parse_hash_method(method) for method in [*ACCEPTED_HASH_METHODS, PASSWORD_HASH_METHOD])
+    target_params = accepted.get(stored_algorithm)
+    if target_params is None or len(stored_params) != len(target_params):
+        return True
+    return any(stored < target for stored, target in zip(stored_params, target_params))
+
+def _recent_attempts(key, now):
+    attempts = auth_attempts.get(key)
+    if attempts is None:
+        return 0
+    while attempts and attempts[0] <= now - LOGIN_ATTEMPT_WINDOW:
+        attempts.popleft()
+    if not attempts:
+        del auth_attempts[key]
+        return 0
+    return len(attempts)
+
+def reserve_attempt(limits):
+    """Checks (key, max_attempts) pairs against the sliding window and, if none is exceeded,
+    records the attempt under every key in the same critical section.
+
+    Returns False when throttled. Reserving up front means concurrent requests cannot all
+    pass the check before any of them is counted.
+    """
+    now = time.monotonic()
+    with auth_attempts_lock:
+        # Sweep stale keys so a spray of random usernames cannot grow the table forever
+        if len(auth_attempts) > 10000:
+            for stale_key in list(auth_attempts):
+                _recent_attempts(stale_key, now)
+        if any(_recent_attempts(key, now) >= limit for key, limit in limits):
+            return False
+        for key, limit in limits:
+            auth_attempts.setdefault(key, deque()).append(now)
+        return True
+
+def release_attempt(key):
+    """Gives back one reserved attempt, e.g. after a successful login."""
+    with auth_attempts_lock:
+        attempts = auth_attempts.get(key)
+        if attempts:
+            attempts.pop()
+            if not attempts:
+                del auth_attempts[key]
+
+def clear_attempts(*keys):
+    with auth_attempts_lock:
+        for key in keys:
+            auth_attempts.pop(key, None)
 
 # --- Flask-Login Setup ---
 login_manager = LoginManager()
@@ -116,6 +412,11 @@ def login():
     if request.method == 'POST':
         username = request.form['username']
         password = request.form['password']
+        user_key = ('user', username.lower())
+        ip_key = ('ip', request.remote_addr)
+        if not reserve_attempt([(user_key, LOGIN_MAX_ATTEMPTS_PER_USER), (ip_key, LOGIN_MAX_ATTEMPTS_PER_IP)]):
+            flash('Too many login attempts. Please try again later.', 'danger')
+            return render_template('login.html'), 429
         conn = get_db_connection()
         if not conn:
             flash('Database connection failed.', 'danger')
@@ -124,7 +425,16 @@ def login():
         cursor.execute("SELECT * FROM users WHERE username = %s", (username,))
         user_data = cursor.fetchone()
         conn.close()
-        if user_data and check_password_hash(user_data['password'], password):
+        try:
+            valid = bool(user_data) and verify_password(user_data['password'], password)
+        except HashingBusyError:
+            flash('The server is busy. Please try again in a moment.', 'danger')
+            return render_template('login.html'), 503
+        if valid:
+            clear_attempts(user_key)
+            release_attempt(ip_key)
+            if password_needs_rehash(user_data['password']):
+                upgrade_password_hash(user_data['id'], password)
             user = User(id=user_data['id'], username=user_data['username'], is_admin=user_data.get('is_superadmin', False))
             login_user(user)
             log_action(user.id, "User Login")
@@ -133,6 +443,27 @@ def login():
             flash('Invalid username or password.', 'danger')
     return render_template('login.html')
 
+def upgrade_password_hash(user_id, password):
+    """Re-hashes a password with the current parameters in the background; skipped if the pool is busy."""
+    try:
+        submit_hashing(store_password_hash, user_id, password)
+    except HashingBusyError:
+        pass
+
+def store_password_hash(user_id, password):
+    # Runs on the hashing pool where nobody reads the result, so failures are reported here
+    new_hash = generate_password_hash(password, method=PASSWORD_HASH_METHOD)
+    conn = get_db_connection()
+    if not conn: return
+    try:
+        cursor = conn.cursor()
+        cursor.execute("UPDATE users SET password = %s WHERE id = %s", (new_hash, user_id))
+        conn.commit()
+    except mysql.connector.Error as err:
+        print(f"Error upgrading password hash for user {user_id}: {err}")
+    finally:
+        conn.close()
+
 @app.route('/register', methods=['GET', 'POST'])
 def register():
     if request.method == 'POST':
@@ -141,7 +472,15 @@ def register():
         full_name = request.form['full_name']
         email = request.form['email']
         mobile = request.form['mobile_number']
-        hashed_password = generate_password_hash(password, method='pbkdf2:sha256')
+        register_key = ('register-ip', request.remote_addr)
+        if not reserve_attempt([(register_key, REGISTER_MAX_ATTEMPTS_PER_IP)]):
+            flash('Too many attempts. Please try again later.', 'danger')
+            return render_template('register.html'), 429
+        try:
+            hashed_password = hash_password(password)
+        except HashingBusyError:
+            flash('The server is busy. Please try again in a moment.', 'danger')
+            return render_template('register.html'), 503
         conn = get_db_connection()
         if not conn:
             flash('Database connection failed.', 'danger')
@@ -305,6 +644,7 @@ def delete_household(household_id):
     log_action(current_user.id, "Household Deleted", f"Deleted household '{household['name']}' (ID: {household_id})")
     cursor.execute("DELETE FROM households WHERE id = %s", (household_id,))
     conn.commit()
+    shopping.invalidate(household_id)
     conn.close()
     flash(f"Household '{household['name']}' has been permanently deleted.", "success")
     return redirect(url_for('households'))
@@ -377,6 +717,7 @@ def add_item(household_id):
         val = (household_id, name, category, item_type, quantity, quantity_unit, status, is_essential, purchase_date, expiry_date, current_user.id)
         cursor.execute(sql, val)
         conn.commit()
+        shopping.invalidate(household_id)
         log_action(current_user.id, "Item Added", f"Item: {name}", household_id)
         conn.close()
         return redirect(url_for('view_household', household_id=household_id))
@@ -406,6 +747,7 @@ def update_item_inline(household_id, item_id):
         sql = f"UPDATE groceries SET {field} = %s, modified_by = %s WHERE id = %s AND household_id = %s"
         cursor.execute(sql, (value, current_user.id, item_id, household_id))
         conn.commit()
+        shopping.invalidate(household_id)
         log_action(current_user.id, "Item Inline Update", f"Updated {field} for item ID {item_id}", household_id)
         return jsonify({'success': True, 'message': 'Item updated successfully.'})
     except Exception as e:
@@ -435,6 +777,7 @@ def edit_item(household_id, item_id):
         val = (name, category, item_type, quantity, quantity_unit, status, is_essential, purchase_date, expiry_date, current_user.id, item_id, household_id)
         cursor.execute(sql, val)
         conn.commit()
+        shopping.invalidate(household_id)
         log_action(current_user.id, "Item Edited", f"Item ID: {item_id}", household_id)
         conn.close()
         return redirect(url_for('view_household', household_id=household_id))
@@ -453,6 +796,7 @@ def delete_item(household_id, item_id):
     cursor = conn.cursor()
     cursor.execute("DELETE FROM groceries WHERE id = %s AND household_id = %s", (item_id, household_id))
     conn.commit()
+    shopping.invalidate(household_id)
     log_action(current_user.id, "Item Deleted", f"Item ID: {item_id}", household_id)
     conn.close()
     return redirect(url_for('view_household', household_id=household_id))
@@ -490,61 +834,25 @@ def dashboard(household_id):
 @login_required
 @household_member_required
 def shopping_list(household_id):
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
-    today = date.today()
-    
-    shopping_list_query = "SELECT g.*, p.icon_class FROM groceries g LEFT JOIN pantry_items p ON g.name = p.name WHERE g.household_id = %s AND (g.status IN ('Running low', 'Buy More') OR g.expiry_date < %s) ORDER BY g.is_essential DESC, g.category ASC, g.name ASC"
-    cursor.execute(shopping_list_query, (household_id, today))
-    all_shopping_items = cursor.fetchall()
-    
-    conn.close()
-
-    essential_items_flat = []
-    optional_items_flat = []
-
-    for item in all_shopping_items:
-        is_expired = item.get('expiry_date') and item['expiry_date'] < today
-        if is_expired:
-            item['reason'] = 'Expired'
-        elif item['status'] == 'Buy More':
-            item['reason'] = 'Buy More'
-        else:
-            item['reason'] = 'Running low'
-        
-        if item['is_essential']:
-            essential_items_flat.append(item)
-        else:
-            optional_items_flat.append(item)
-
-    grouped_essential = {c: [i for i in essential_items_flat if i['category'] == c] for c in {i['category'] for i in essential_items_flat}}
-    grouped_optional = {c: [i for i in optional_items_flat if i['category'] == c] for c in {i['category'] for i in optional_items_flat}}
-
-    return render_template('shopping_list.html', 
-                           essential_items=essential_items_flat, 
-                           optional_items=optional_items_flat,
-                           grouped_essential_items=grouped_essential,
-                           grouped_optional_items=grouped_optional,
-                           household_id=household_id)
+    list_data = shopping.get_shopping_list(household_id, get_db_connection)
+    if list_data is None: return "Error", 500
+    return render_template('shopping_list.html', household_id=household_id, **list_data)
 
 @app.route('/household/<int:household_id>/export_shopping_list')
 @login_required
 @household_member_required
 def export_shopping_list(household_id):
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
-    today = date.today()
-    
-    shopping_list_query = "SELECT name, is_essential FROM groceries WHERE household_id = %s AND (status IN ('Running low', 'Buy More') OR expiry_date < %s) ORDER BY is_essential DESC, name ASC"
-    cursor.execute(shopping_list_query, (household_id, today))
-    all_items = cursor.fetchall()
-    
-    essential_items = [item for item in all_items if item['is_essential']]
-    optional_items = [item for item in all_items if not item['is_essential']]
-    
-    conn.close()
+    list_data = shopping.get_shopping_list(household_id, get_db_connection)
+    if list_data is None: return "Error", 500
     export_time = datetime.now().strftime("%Y-%m-%d %I:%M %p")
-    return render_template('export_checklist.html', essential_items=essential_items, optional_items=optional_items, export_time=export_time, household_id=household_id)
+    export_format = request.args.get('format', 'html')
+    if export_format == 'txt':
+        return Response(shopping.iter_text(list_data, export_time), mimetype='text/plain',
+                        headers={'Content-Disposition': 'attachment; filename=shopping_list.txt'})
+    if export_format == 'csv':
+        return Response(shopping.iter_csv(list_data), mimetype='text/csv',
+                        headers={'Content-Disposition': 'attachment; filename=shopping_list.csv'})
+    return render_template('export_checklist.html', essential_items=shopping.export_items(list_data, 'essential'), optional_items=shopping.export_items(list_data, 'optional'), export_time=export_time, household_id=household_id)
 
 @app.route('/household/<int:household_id>/pantry', methods=['GET', 'POST'])
 @login_required
@@ -571,6 +879,7 @@ def pantry(household_id):
                 except mysql.connector.IntegrityError:
                     pass # Item might already exist, ignore for now
         conn.commit()
+        shopping.invalidate(household_id)
         log_action(current_user.id, "Added from Pantry", f"Added {len(items_to_add)} items.", household_id)
         flash(f"Added {len(items_to_add)} items from the master pantry list.", 'success')
         conn.close()
@@ -590,6 +899,16 @@ def pantry(household_id):
         grouped_pantry_items[category].append(item)
     return render_template('pantry.html', grouped_pantry_items=grouped_pantry_items, household_items=household_items, household_id=household_id, units=UNITS, statuses=STATUSES)
 
+# --- Admin Routes ---
+@app.route('/admin/compression_stats')
+@login_required
+def compression_stats_report():
+    if not current_user.is_admin():
+        return jsonify({'success': False, 'message': 'Admin access required.'}), 403
+    with compression_stats_lock:
+        report = {route: dict(stats) for route, stats in compression_stats.items()}
+    return jsonify({'success': True, 'routes': report})
+
 # --- Main Execution ---
 if __name__ == '__main__':
     app.run(host='0.0.0.0', debug=True)
@@ -0,0 +1,119 @@
+# shopping.py
+# Builds and caches each household's shopping list for the page and its exports
+import csv
+import io
+import itertools
+import threading
+import time
+from datetime import date
+
+import config
+
+SHOPPING_LIST_QUERY = "SELECT g.*, p.icon_class FROM groceries g LEFT JOIN pantry_items p ON g.name = p.name WHERE g.household_id = %s AND (g.status IN ('Running low', 'Buy More') OR g.expiry_date < %s) ORDER BY g.is_essential DESC, g.category ASC, g.name ASC"
+
+# Changes made by other worker processes show up in this stamp, so a hit is revalidated against it
+FRESHNESS_QUERY = "SELECT MAX(modified_on) AS last_modified, COUNT(*) AS item_count FROM groceries WHERE household_id = %s"
+
+# Upper bound on staleness for changes the freshness stamp cannot see (pantry icons, writes in the same second)
+CACHE_TTL = getattr(config, 'SHOPPING_CACHE_TTL', 60)
+# Spreadsheet apps treat cells starting with these as formulas
+CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+_cache = {}
+# Bumped on every invalidation so a list built during a write is not cached
+_generations = {}
+_cache_lock = threading.Lock()
+
+def build_shopping_list(items, today):
+    """Tags each item with its reason and splits the list into essential/optional groups in one pass."""
+    shopping_list = {'essential_items': [], 'optional_items': [], 'grouped_essential_items': {}, 'grouped_optional_items': {}}
+    for item in items:
+        if item.get('expiry_date') and item['expiry_date'] < today:
+            item['reason'] = 'Expired'
+        elif item['status'] == 'Buy More':
+            item['reason'] = 'Buy More'
+        else:
+            item['reason'] = 'Running low'
+
+        kind = 'essential' if item['is_essential'] else 'optional'
+        shopping_list[f'{kind}_items'].append(item)
+        # Rows arrive sorted by category, so groups keep that order
+        shopping_list[f'grouped_{kind}_items'].setdefault(item['category'], []).append(item)
+    return shopping_list
+
+def get_shopping_list(household_id, get_db_connection):
+    """Returns the cached shopping list for a household, querying the database on a miss.
+
+    Returns None if the database is unreachable. The cached structure is shared between
+    requests and must be treated as read-only.
+    """
+    today = date.today()
+    now = time.monotonic()
+    with _cache_lock:
+        entry = _cache.get(household_id)
+        generation = _generations.get(household_id, 0)
+
+    conn = get_db_connection()
+    if not conn: return None
+    cursor = conn.cursor(dictionary=True)
+    # Read the stamp before the list, so a write landing in between makes the next check miss
+    cursor.execute(FRESHNESS_QUERY, (household_id,))
+    row = cursor.fetchone()
+    stamp = (row['last_modified'], row['item_count'])
+    # Expiry depends on today's date, so a list built yesterday is stale too
+    if entry and entry['date'] == today and entry['stamp'] == stamp and now - entry['built_at'] < CACHE_TTL:
+        conn.close()
+        return entry['shopping_list']
+
+    cursor.execute(SHOPPING_LIST_QUERY, (household_id, today))
+    items = cursor.fetchall()
+    conn.close()
+    shopping_list = build_shopping_list(items, today)
+    with _cache_lock:
+        if _generations.get(household_id, 0) == generation:
+            _cache[household_id] = {'date': today, 'built_at': now, 'stamp': stamp, 'shopping_list': shopping_list}
+    return shopping_list
+
+def invalidate(household_id):
+    """Drops a household's cached list; call after any write to its groceries."""
+    with _cache_lock:
+        _cache.pop(household_id, None)
+        _generations[household_id] = _generations.get(household_id, 0) + 1
+
+def export_items(shopping_list, kind):
+    """Returns the essential or optional items alphabetically, the order printed checklists use."""
+    return sorted(shopping_list[f'{kind}_items'], key=lambda item: item['name'].lower())
+
+def csv_safe(value):
+    """Prefixes a cell with ' so spreadsheet apps don't run it as a formula."""
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+def iter_text(shopping_list, export_time):
+    """Yields a plain-text checklist line by line."""
+    yield f"Shopping Checklist\nExported on: {export_time}\n"
+    for title, kind in (('Essential Items', 'essential'), ('Optional Items', 'optional')):
+        yield f"\n{title}\n"
+        items = export_items(shopping_list, kind)
+        if not items:
+            yield f"(no {kind} items to buy)\n"
+        for item in items:
+            yield f"[ ] {item['name']}\n"
+
+def iter_csv(shopping_list):
+    """Yields the list as CSV rows, one row per item."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def row(values):
+        writer.writerow([csv_safe(value) for value in values])
+        line = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return line
+
+    yield row(['name', 'category', 'essential', 'reason', 'quantity', 'quantity_unit', 'expiry_date'])
+    for item in itertools.chain(export_items(shopping_list, 'essential'), export_items(shopping_list, 'optional')):
+        yield row([item['name'], item['category'], 'yes' if item['is_essential'] else 'no', item['reason'],
+                   item['quantity'], item['quantity_unit'], item.get('expiry_date') or ''])